@@ -8,12 +8,19 @@ import subprocess
 import platform
 import os
 import shutil
+import shlex
 
 from PyQt6.QtCore import QProcess
 
+from src.utils.photo_files import list_photos
+
 class ADBManager:
     """Gère les interactions avec les appareils Android via adb et scrcpy."""
 
+    # Taille maximale d'une commande rm groupée : les appareils anciens
+    # (protocole shell v1) refusent les messages adb de plus de 4 Ko
+    _RM_SCRIPT_MAX_BYTES = 3000
+
     def __init__(self):
         """
         Initialise le gestionnaire ADB.
@@ -66,8 +73,7 @@ class ADBManager:
 
                 # Démarre le serveur avec l'ADB trouvé
                 subprocess.run(
-                    f'"{adb_path}" start-server',
-                    shell=True,
+                    [adb_path, "start-server"],
                     capture_output=True,
                     text=True,
                     timeout=10  # Timeout de 10 secondes
@@ -97,22 +103,7 @@ class ADBManager:
                 logger.error("ADB n'est pas initialisé correctement")
                 return False
 
-            result = subprocess.run(
-                f'"{self.adb_command}" devices',
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=5  # Timeout de 5 secondes
-            )
-
-            logger.debug(f"Résultat de adb devices: {result.stdout}")
-
-            devices = []
-            for line in result.stdout.splitlines()[1:]:
-                if '\tdevice' in line:
-                    device_id = line.split('\t')[0]
-                    devices.append(device_id)
-                    logger.debug(f"Appareil trouvé: {device_id}")
+            devices = self.list_devices()
 
             if devices:
                 self.current_device = devices[0]
@@ -129,10 +120,45 @@ class ADBManager:
             logger.error(f"Erreur de connexion ADB: {e}")
             return False
 
+    def list_devices(self) -> List[str]:
+        """
+        Liste les identifiants des appareils prêts (état 'device').
+
+        Raises:
+            subprocess.TimeoutExpired: si adb ne répond pas dans les 5 secondes
+        """
+        result = subprocess.run(
+            [self.adb_command, "devices"],
+            capture_output=True,
+            text=True,
+            timeout=5  # Timeout de 5 secondes
+        )
+
+        logger.debug(f"Résultat de adb devices: {result.stdout}")
+
+        devices = []
+        for line in result.stdout.splitlines()[1:]:
+            if '\tdevice' in line:
+                device_id = line.split('\t')[0]
+                devices.append(device_id)
+                logger.debug(f"Appareil trouvé: {device_id}")
+
+        return devices
+
     def is_connected(self) -> bool:
         """Vérifie si un appareil est connecté."""
         return bool(self.current_device)
 
+    def device_command(self, *args: str) -> List[str]:
+        """
+        Construit la ligne de commande adb ciblant l'appareil courant.
+
+        Les arguments sont passés directement au processus adb, sans
+        passer par le shell du système (pas de fork cmd.exe / sh ni
+        problème de guillemets).
+        """
+        return [self.adb_command, "-s", self.current_device, *args]
+
     def _get_adb_paths(self) -> List[str]:
         """Retourne une liste de chemins ADB possibles dans l'ordre de préférence."""
         paths = []
@@ -175,8 +201,7 @@ class ADBManager:
         """Teste si un chemin ADB fonctionne."""
         try:
             result = subprocess.run(
-                f'"{adb_path}" version',
-                shell=True,
+                [adb_path, "version"],
                 capture_output=True,
                 text=True
             )
@@ -196,17 +221,19 @@ class ADBManager:
                 'android_version': 'ro.build.version.release'
             }
 
-            device_info = {}
-            for key, prop in cmd_props.items():
-                result = subprocess.run(
-                    f'"{self.adb_command}" -s {self.current_device} shell getprop {prop}',
-                    shell=True,
-                    capture_output=True,
-                    text=True
-                )
-                device_info[key] = result.stdout.strip()
+            # Un seul aller-retour adb : une ligne de sortie par propriété
+            script = "; ".join(f"getprop {prop}" for prop in cmd_props.values())
+            result = subprocess.run(
+                self.device_command("shell", script),
+                capture_output=True,
+                text=True
+            )
 
-            return device_info
+            values = result.stdout.splitlines()
+            values += [""] * (len(cmd_props) - len(values))
+            return {
+                key: value.strip() for key, value in zip(cmd_props, values)
+            }
 
         except Exception as e:
             logger.error(f"Erreur lors de la récupération des infos: {e}")
@@ -241,42 +268,26 @@ class ADBManager:
                 "/storage/emulated/0/DCIM"
             ]
 
-            all_photos = []
-
-            for dir_path in paths:
-                logger.debug(f"Recherche de photos dans: {dir_path}")
-
-                # Liste d'abord le contenu du dossier sans filtre
-                cmd_list = f'"{self.adb_command}" -s {self.current_device} shell ls "{dir_path}"'
-                result_list = subprocess.run(cmd_list, shell=True, capture_output=True,
-                                             text=True)
+            # Un seul appel adb : le shell de l'appareil développe les jokers
+            # (JPG et jpg) de tous les dossiers, les erreurs "No such file"
+            # des dossiers absents ou vides sont ignorées
+            patterns = ["*.JPG", "*.jpg"]
+            script = "; ".join(
+                f'ls "{dir_path}"/{pattern} 2>/dev/null'
+                for dir_path in paths
+                for pattern in patterns
+            )
+            logger.debug(f"Recherche de photos dans: {', '.join(paths)}")
+            result = subprocess.run(
+                self.device_command("shell", script), capture_output=True, text=True
+            )
 
-                if result_list.returncode == 0:
-                    logger.debug(f"Contenu de {dir_path}: {result_list.stdout}")
-                else:
-                    logger.debug(f"Erreur listing {dir_path}: {result_list.stderr}")
-
-                # Cherche les photos avec les deux patterns (JPG et jpg)
-                patterns = ["*.JPG", "*.jpg"]
-                for pattern in patterns:
-                    cmd_photos = f'"{self.adb_command}" -s {self.current_device} shell ls "{dir_path}/{pattern}"'
-                    result_photos = subprocess.run(cmd_photos, shell=True,
-                                                   capture_output=True, text=True)
-
-                    if result_photos.returncode == 0 and not "No such file or directory" in result_photos.stderr:
-                        photos = [f.strip() for f in result_photos.stdout.splitlines()
-                                  if
-                                  f.strip() and not "*" in f]  # Évite les wildcards non résolus
-
-                        # Ajoute le chemin complet
-                        full_path_photos = [
-                            f if f.startswith('/') else f"{dir_path}/{f}" for f in
-                            photos]
-                        all_photos.extend(full_path_photos)
-                        if photos:
-                            logger.debug(
-                                f"Trouvé {len(photos)} photos en {pattern} dans {dir_path}")
-                            logger.debug(f"Exemple de photo: {full_path_photos[0]}")
+            all_photos = [
+                f.strip() for f in result.stdout.splitlines()
+                if f.strip() and not "*" in f  # Évite les wildcards non résolus
+            ]
+            if all_photos:
+                logger.debug(f"Exemple de photo: {all_photos[0]}")
 
             # Log le résultat final
             if all_photos:
@@ -291,6 +302,39 @@ class ADBManager:
             logger.exception(e)
             return []
 
+    def _remove_phone_photos(self, phone_photos: list[str]):
+        """
+        Supprime des photos de l'appareil par lots de commandes rm.
+
+        adb transmet la ligne au shell de l'appareil telle quelle : chaque
+        chemin est protégé. Les lots restent sous _RM_SCRIPT_MAX_BYTES ; un lot
+        refusé est repris photo par photo.
+        """
+        batches = []
+        batch = []
+        size = len("rm")
+        for phone_photo in phone_photos:
+            quoted = shlex.quote(phone_photo)
+            if batch and size + 1 + len(quoted.encode()) > self._RM_SCRIPT_MAX_BYTES:
+                batches.append(batch)
+                batch = []
+                size = len("rm")
+            batch.append(quoted)
+            size += 1 + len(quoted.encode())
+        if batch:
+            batches.append(batch)
+
+        for batch in batches:
+            rm_cmd = self.device_command("shell", "rm " + " ".join(batch))
+            if subprocess.run(rm_cmd).returncode == 0:
+                continue
+
+            logger.warning(
+                f"Suppression groupée refusée par l'appareil, "
+                f"reprise photo par photo ({len(batch)} photos)")
+            for quoted in batch:
+                subprocess.run(self.device_command("shell", f"rm {quoted}"))
+
     def take_photo(self, save_path: Path, status_callback=None) -> bool:
         """
         Prend une photo et transfère toutes les photos du téléphone.
@@ -308,8 +352,8 @@ class ADBManager:
                 status_callback("Prise de photo...")
 
             logger.debug("Déclenchement de la capture via bouton volume")
-            volume_cmd = f'"{self.adb_command}" -s {self.current_device} shell input keyevent 24'
-            subprocess.run(volume_cmd, shell=True, check=True)
+            volume_cmd = self.device_command("shell", "input", "keyevent", "24")
+            subprocess.run(volume_cmd, check=True)
 
             # Étape 2 : Attente enregistrement
             if status_callback:
@@ -353,11 +397,16 @@ class ADBManager:
             photo_type = save_path.stem.split('_')[-2]
 
             # Trouve le dernier numéro utilisé dans le dossier pour ce type
-            existing_photos = list(save_path.parent.glob(f"*_{photo_type}_*.jpg"))
+            marker = f"_{photo_type}_"
+            existing_stems = [
+                Path(name).stem for name in list_photos(save_path.parent)
+            ]
             last_num = 0
-            for photo in existing_photos:
+            for stem in existing_stems:
+                if marker not in stem:
+                    continue
                 try:
-                    num = int(photo.stem.split('_')[-1])
+                    num = int(stem.split('_')[-1])
                     last_num = max(last_num, num)
                 except (ValueError, IndexError):
                     continue
@@ -378,9 +427,8 @@ class ADBManager:
                     if status_callback:
                         status_callback(f"Transfert photo {i}/{total_photos}...")
 
-                pull_cmd = f'"{self.adb_command}" -s {self.current_device} pull "{phone_photo}" "{new_name}"'
-                result = subprocess.run(pull_cmd, shell=True, capture_output=True,
-                                        text=True)
+                pull_cmd = self.device_command("pull", phone_photo, str(new_name))
+                result = subprocess.run(pull_cmd, capture_output=True, text=True)
 
                 if result.returncode == 0:
                     logger.info(f"Photo transférée avec succès vers {new_name}")
@@ -394,9 +442,7 @@ class ADBManager:
                 if status_callback:
                     status_callback("Nettoyage du téléphone...")
 
-                for phone_photo in phone_photos:
-                    rm_cmd = f'"{self.adb_command}" -s {self.current_device} shell rm "{phone_photo}"'
-                    subprocess.run(rm_cmd, shell=True)
+                self._remove_phone_photos(phone_photos)
                 logger.info("Photos supprimées du téléphone après transfert")
 
                 if status_callback:
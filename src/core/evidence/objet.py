@@ -6,6 +6,8 @@ from pathlib import Path
 from typing import List, Optional
 from loguru import logger
 
+from src.utils.photo_files import list_photos
+
 
 
 class ObjetEssai(EvidenceBase):
@@ -70,7 +72,11 @@ class ObjetEssai(EvidenceBase):
         logger.debug(f"Recherche des photos pour l'objet {item_id}")
         photos = []
 
-        for photo_path in self.base_path.glob(f"*{item_id}_*.jpg"):
+        marker = f"{item_id}_"
+        for name in list_photos(self.base_path):
+            photo_path = self.base_path / name
+            if marker not in photo_path.stem:
+                continue
             try:
                 # On part de la fin du nom pour plus de fiabilité
                 parts = photo_path.stem.split("_")
@@ -106,7 +112,8 @@ class ObjetEssai(EvidenceBase):
             self._created_objects = set()
 
         # Ajoute les objets trouvés dans les photos
-        for photo_path in self.base_path.glob("*.jpg"):
+        for name in list_photos(self.base_path):
+            photo_path = self.base_path / name
             try:
                 parts = photo_path.stem.split('_')
                 if len(parts) >= 2:
@@ -3,6 +3,9 @@ from .base import EvidenceBase, EvidenceItem, Photo
 from typing import List, Optional
 from loguru import logger
 
+from src.utils.photo_files import list_photos
+
+
 class Scelle(EvidenceBase):
     """Gestion des scellés et de leurs photos."""
 
@@ -85,8 +88,8 @@ class Scelle(EvidenceBase):
             logger.warning(f"Scellé {item_name} non trouvé")
             return []
 
-        pattern = "*.jpg"
-        for photo_path in scelle_path.glob(pattern):
+        for name in list_photos(scelle_path):
+            photo_path = scelle_path / name
             try:
                 # On part de la fin du nom pour trouver le numéro de séquence et le type
                 parts = photo_path.stem.split("_")
@@ -11,10 +11,11 @@ from PyQt6.QtWidgets import (
     QGridLayout,
     QMessageBox,
     QGroupBox,
+    QMainWindow,
 )
 from PyQt6.QtWidgets import QScrollArea, QWidget as QWidgetBase
 
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QCursor
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtWidgets import QPushButton
@@ -22,6 +23,7 @@ from PyQt6.QtWidgets import QPushButton
 from pathlib import Path
 from loguru import logger
 from typing import Optional
+import re
 import subprocess
 
 from src.core.device import ADBManager
@@ -29,6 +31,11 @@ from src.ui.widgets.adb_status import ADBStatusWidget
 from src.ui.widgets.log_viewer import QtHandler, ColoredLogViewer
 from src.ui.widgets.operation_popup import OperationPopup
 from src.utils.error_handler import UserFriendlyErrorHandler
+from src.utils.photo_files import list_photos
+from src.utils.worker import BackgroundTask
+
+# Identifiant d'objet dans un nom de photo : une majuscule entre deux "_"
+_OBJECT_MARKER_RE = re.compile(r"_[A-Z]_")
 
 
 class ControlPanel(QWidget):
@@ -48,6 +55,9 @@ class ControlPanel(QWidget):
         self.current_scelle_path: Optional[Path] = None
         self.current_object_id: Optional[str] = None
 
+        # Status bar de la fenêtre principale, résolue au premier message
+        self._status_bar = None
+
         self._setup_ui()
 
     def _setup_ui(self):
@@ -232,22 +242,38 @@ class ControlPanel(QWidget):
             popup = OperationPopup(self)
             popup.show()
 
-            def update_status(message):
-                popup.update_message(message)
-                QApplication.processEvents()
+            # Prise de photo dans le QThreadPool : l'interface reste réactive
+            # pendant l'attente d'enregistrement et les transferts
+            task = BackgroundTask(self.adb_manager.take_photo, save_path)
+            task.kwargs["status_callback"] = task.signals.progress.emit
+            task.signals.progress.connect(popup.update_message)
+            task.signals.finished.connect(
+                lambda success: self._on_photo_finished(
+                    success, popup, photo_type, prefix, save_path
+                )
+            )
+            task.signals.failed.connect(lambda e: self._on_photo_failed(e, popup))
+            task.start()
 
-            # Prise de photo avec suivi d'état
-            success = self.adb_manager.take_photo(save_path, update_status)
+        except Exception as e:
+            title, message = UserFriendlyErrorHandler.handle_adb_error(
+                e, "la prise de photo"
+            )
+            QMessageBox.warning(self, title, message)
+            self._end_photo_operation()
 
-            # Fermeture de la popup
-            popup.close_popup()
+    def _on_photo_finished(
+        self, success: bool, popup: OperationPopup, photo_type: str, prefix: str,
+        save_path: Path
+    ):
+        """Traite le résultat de la prise de photo (thread GUI)."""
+        popup.close_popup()
 
+        try:
             if success:
+                # Le message s'efface de lui-même après 3 secondes
                 self._show_status_message(f"Photo(s) sauvegardée(s) pour {prefix}")
                 self.photo_taken.emit(photo_type, str(save_path))
-
-                # Auto-effacement du message après 3 secondes
-                QTimer.singleShot(3000, lambda: self._show_status_message(""))
             else:
                 QMessageBox.warning(
                     self,
@@ -258,16 +284,19 @@ class ControlPanel(QWidget):
                     "• Prenez une photo manuellement puis réessayez\n"
                     "• Vérifiez la connexion de l'appareil",
                 )
-
-        except Exception as e:
-            title, message = UserFriendlyErrorHandler.handle_adb_error(
-                e, "la prise de photo"
-            )
-            QMessageBox.warning(self, title, message)
-
         finally:
             self._end_photo_operation()
 
+    def _on_photo_failed(self, error: Exception, popup: OperationPopup):
+        """Affiche l'erreur survenue pendant la prise de photo (thread GUI)."""
+        popup.close_popup()
+
+        title, message = UserFriendlyErrorHandler.handle_adb_error(
+            error, "la prise de photo"
+        )
+        QMessageBox.warning(self, title, message)
+        self._end_photo_operation()
+
     def _open_camera(self):
         """Ouvre l'application appareil photo sur le téléphone."""
         try:
@@ -277,20 +306,23 @@ class ControlPanel(QWidget):
                 return
 
             # Séquence de déverrouillage et ouverture caméra
+            device_cmd = self.adb_manager.device_command
             commands = [
                 # Réveil de l'appareil
-                f'"{self.adb_manager.adb_command}" -s {self.adb_manager.current_device} shell input keyevent KEYCODE_WAKEUP',
+                device_cmd("shell", "input", "keyevent", "KEYCODE_WAKEUP"),
                 # Déverrouillage par swipe
-                f'"{self.adb_manager.adb_command}" -s {self.adb_manager.current_device} shell input swipe 500 1800 500 1000',
+                device_cmd("shell", "input", "swipe", "500", "1800", "500", "1000"),
                 # Ouverture de l'appareil photo
-                f'"{self.adb_manager.adb_command}" -s {self.adb_manager.current_device} shell am start -a android.media.action.STILL_IMAGE_CAMERA',
+                device_cmd(
+                    "shell", "am", "start", "-a", "android.media.action.STILL_IMAGE_CAMERA"
+                ),
             ]
 
             import time
 
             for i, command in enumerate(commands):
                 subprocess.run(
-                    command, shell=True, capture_output=True, text=True, timeout=5
+                    command, capture_output=True, text=True, timeout=5
                 )
                 if i < len(commands) - 1:  # Pause entre les commandes
                     time.sleep(0.5)
@@ -311,11 +343,14 @@ class ControlPanel(QWidget):
             return 1
 
         max_num = 0
-        pattern = f"*{prefix}_*.jpg"
+        marker = f"{prefix}_"
 
-        for photo in self.current_scelle_path.glob(pattern):
+        for name in list_photos(self.current_scelle_path):
+            stem = Path(name).stem
+            if marker not in stem:
+                continue
             try:
-                num = int(photo.stem.split("_")[-1])
+                num = int(stem.split("_")[-1])
                 max_num = max(max_num, num)
             except (ValueError, IndexError):
                 continue
@@ -369,8 +404,12 @@ class ControlPanel(QWidget):
         elif "information" in message.lower():
             message = f"ℹ️ {message}"
 
-        if hasattr(self.parent(), "statusBar"):
-            self.parent().statusBar().showMessage(message, duration)
+        if self._status_bar is None:
+            window = self.window()
+            if not isinstance(window, QMainWindow):
+                return
+            self._status_bar = window.statusBar()
+        self._status_bar.showMessage(message, duration)
 
     def _update_context_info(self):
         """Met à jour les informations contextuelles affichées."""
@@ -404,9 +443,9 @@ class ControlPanel(QWidget):
             return 0
 
         count = 0
-        for photo in self.current_scelle_path.glob("*.jpg"):
+        for name in list_photos(self.current_scelle_path):
             # Exclut les photos d'objets
-            stem_parts = photo.stem.split("_")
+            stem_parts = Path(name).stem.split("_")
             if len(stem_parts) >= 2:
                 type_id = stem_parts[-2]
                 if not (len(type_id) == 1 and type_id.isalpha()):
@@ -418,7 +457,11 @@ class ControlPanel(QWidget):
         if not self.current_scelle_path:
             return 0
 
-        return len(list(self.current_scelle_path.glob(f"*_{object_id}_*.jpg")))
+        marker = f"_{object_id}_"
+        return sum(
+            1 for name in list_photos(self.current_scelle_path)
+            if marker in Path(name).stem
+        )
 
     # === MÉTHODES PUBLIQUES ===
 
@@ -463,9 +506,13 @@ class ControlPanel(QWidget):
             for scelle_path in scelle_folders:
                 # Compte rapide des objets (photos avec une seule lettre)
                 objects_in_scelle = set()
-                for photo in scelle_path.glob("*_[A-Z]_*.jpg"):
+                for name in list_photos(scelle_path):
                     try:
-                        obj_letter = photo.stem.split("_")[-2]
+                        stem = Path(name).stem
+                        # Même règle que l'ancien motif *_[A-Z]_*.jpg
+                        if not _OBJECT_MARKER_RE.search(stem):
+                            continue
+                        obj_letter = stem.split("_")[-2]
                         if len(obj_letter) == 1 and obj_letter.isalpha():
                             objects_in_scelle.add(obj_letter)
                     except:
@@ -495,7 +542,7 @@ class ControlPanel(QWidget):
 
         # Configure le handler Loguru pour rediriger vers ce viewer
         logger.add(
-            QtHandler(self.log_viewer).write,
+            QtHandler(self.log_viewer),
             format="{time:HH:mm:ss} | {level: <8} | {message}"
         )
 
@@ -22,12 +22,14 @@ from PyQt6.QtGui import QFileSystemModel, QStandardItemModel, QStandardItem
 from pathlib import Path
 from loguru import logger
 from typing import Optional
+import os
 from src.config import AppConfig
 from src.ui.dialogs.create_affaire_dialog import CreateAffaireDialog
 from src.ui.dialogs.create_multiple_scelles_dialog import CreateMultipleScellesDialog
 from src.ui.dialogs.create_scelle_dialog import CreateScelleDialog
 from src.ui.widgets.operation_popup import OperationPopup
 from src.ui.widgets.photo_list import PhotoListWidget
+from src.utils.photo_files import list_photos
 from src.core.device import ADBManager
 from src.core.evidence.scelle import Scelle
 from src.core.evidence.objet import ObjetEssai
@@ -489,7 +491,8 @@ class NavigationPanel(QWidget):
         if not case_path.exists():
             return
 
-        scelle_folders = [p for p in case_path.iterdir() if p.is_dir()]
+        with os.scandir(case_path) as entries:
+            scelle_folders = [Path(entry.path) for entry in entries if entry.is_dir()]
         scelle_folders.sort(key=lambda x: x.name.lower())
 
         for scelle_path in scelle_folders:
@@ -561,13 +564,13 @@ class NavigationPanel(QWidget):
             return
 
         photos = []
-        for photo in self.current_scelle_path.glob("*.jpg"):
+        for photo in list_photos(self.current_scelle_path):
             # Exclut les photos d'objets
-            stem_parts = photo.stem.split("_")
+            stem_parts = os.path.splitext(photo)[0].split("_")
             if len(stem_parts) >= 2:
                 type_id = stem_parts[-2]
                 if not (len(type_id) == 1 and type_id.isalpha()):
-                    photos.append(photo.name)
+                    photos.append(photo)
 
         # Tri intelligent par type puis séquence
         def sort_key(photo_name):
@@ -590,9 +593,12 @@ class NavigationPanel(QWidget):
         if not self.current_scelle_path:
             return
 
-        photos = []
-        for photo in self.current_scelle_path.glob(f"*_{object_id}_*.jpg"):
-            photos.append(photo.name)
+        object_tag = f"_{object_id}_"
+        photos = [
+            photo
+            for photo in list_photos(self.current_scelle_path)
+            if object_tag in os.path.splitext(photo)[0]
+        ]
 
         # Tri par numéro de séquence
         def sort_object_photos(photo_name):
@@ -682,7 +688,7 @@ class NavigationPanel(QWidget):
         scelle_name = self.current_scelle_path.name
 
         try:
-            photos_count = len(list(self.current_scelle_path.glob("*.jpg")))
+            photos_count = len(list_photos(self.current_scelle_path))
 
             confirm_msg = (
                 f"Supprimer le scellé '{scelle_name}' ?\n\n"
@@ -746,13 +752,13 @@ class NavigationPanel(QWidget):
         }
 
         try:
-            photos = list(scelle_path.glob("*.jpg"))
+            photos = list_photos(scelle_path)
             analysis["total"] = len(photos)
 
             objects_found = set()
 
             for photo in photos:
-                parts = photo.stem.split("_")
+                parts = os.path.splitext(photo)[0].split("_")
                 if len(parts) >= 2:
                     type_id = parts[-2].lower()
 
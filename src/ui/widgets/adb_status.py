@@ -8,6 +8,7 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QComboBox,
     QVBoxLayout,
+    QMainWindow,
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QCursor
@@ -17,6 +18,7 @@ from loguru import logger
 from src.core.device import ADBManager
 from src.ui.widgets.stream_window import StreamWindow
 from src.ui.widgets.operation_popup import OperationPopup
+from src.utils.worker import BackgroundTask
 
 
 class ADBStatusWidget(QWidget):
@@ -54,6 +56,12 @@ class ADBStatusWidget(QWidget):
             # Popup d'opération réutilisable
             self.operation_popup = None
 
+            # Dernier état affiché (évite de refaire la mise à jour à l'identique)
+            self._last_ui_state = None
+
+            # Status bar de la fenêtre principale, résolue au premier message
+            self._status_bar = None
+
             self._setup_ui()
 
         except Exception as e:
@@ -144,6 +152,15 @@ class ADBStatusWidget(QWidget):
         self.operation_popup.show()
         QApplication.processEvents()
 
+    def _show_status_message(self, message: str, duration: int):
+        """Affiche un message dans la status bar de la fenêtre principale."""
+        if self._status_bar is None:
+            window = self.window()
+            if not isinstance(window, QMainWindow):
+                return
+            self._status_bar = window.statusBar()
+        self._status_bar.showMessage(message, duration)
+
     def _close_operation_popup(self):
         """Ferme la popup d'opération actuelle."""
         if self.operation_popup:
@@ -173,13 +190,16 @@ class ADBStatusWidget(QWidget):
         # Désactive le bouton temporairement
         self.retry_adb_btn.setEnabled(False)
 
-        # Simule un petit délai pour que l'utilisateur voit la popup
-        QTimer.singleShot(500, self._perform_adb_retry)
+        # La recherche d'ADB (plusieurs chemins testés) tourne hors du thread GUI
+        task = BackgroundTask(self.adb_manager.retry_adb_initialization)
+        task.signals.finished.connect(self._on_adb_retry_finished)
+        task.signals.failed.connect(self._on_adb_retry_failed)
+        task.start()
 
-    def _perform_adb_retry(self):
-        """Effectue la réinitialisation ADB."""
+    def _on_adb_retry_finished(self, success: bool):
+        """Traite le résultat de la réinitialisation ADB."""
         try:
-            if self.adb_manager.retry_adb_initialization():
+            if success:
                 # Succès
                 self._close_operation_popup()
                 self.retry_adb_btn.setVisible(False)
@@ -189,26 +209,25 @@ class ADBStatusWidget(QWidget):
                 self._refresh_devices()
 
                 # Message de succès dans la status bar seulement
-                if hasattr(self.parent(), "statusBar"):
-                    self.parent().statusBar().showMessage(
-                        "✅ ADB initialisé avec succès", 3000
-                    )
+                self._show_status_message("✅ ADB initialisé avec succès", 3000)
                 logger.info("ADB réinitialisé avec succès")
             else:
                 # Échec
                 self._close_operation_popup()
                 self.retry_adb_btn.setEnabled(True)
                 # Message d'erreur dans la status bar seulement
-                if hasattr(self.parent(), "statusBar"):
-                    self.parent().statusBar().showMessage(
-                        "❌ ADB toujours indisponible - Vérifiez l'installation", 5000
-                    )
+                self._show_status_message(
+                    "❌ ADB toujours indisponible - Vérifiez l'installation", 5000
+                )
         except Exception as e:
-            self._close_operation_popup()
-            self.retry_adb_btn.setEnabled(True)
-            # Message d'erreur dans la status bar seulement
-            if hasattr(self.parent(), "statusBar"):
-                self.parent().statusBar().showMessage(f"❌ Erreur ADB: {str(e)}", 5000)
+            self._on_adb_retry_failed(e)
+
+    def _on_adb_retry_failed(self, error: Exception):
+        """Gère une erreur survenue pendant la réinitialisation ADB."""
+        self._close_operation_popup()
+        self.retry_adb_btn.setEnabled(True)
+        # Message d'erreur dans la status bar seulement
+        self._show_status_message(f"❌ Erreur ADB: {str(error)}", 5000)
 
     def _refresh_devices(self):
         """Rafraîchit la liste des appareils avec feedback visuel qt-material."""
@@ -226,27 +245,16 @@ class ADBStatusWidget(QWidget):
         self.refresh_btn.setEnabled(False)
         self.connect_btn.setEnabled(False)
 
-        # Effectue la recherche après un délai pour que la popup soit visible
-        QTimer.singleShot(300, self._perform_device_refresh)
+        # 'adb devices' tourne hors du thread GUI
+        task = BackgroundTask(self.adb_manager.list_devices)
+        task.signals.finished.connect(self._on_devices_listed)
+        task.signals.failed.connect(self._on_device_refresh_failed)
+        task.start()
 
-    def _perform_device_refresh(self):
-        """Effectue la recherche d'appareils."""
+    def _on_devices_listed(self, devices: list[str]):
+        """Affiche les appareils détectés."""
         try:
-            result = subprocess.run(
-                f'"{self.adb_manager.adb_command}" devices',
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-
             self.devices_combo.clear()
-            devices = []
-            for line in result.stdout.splitlines()[1:]:
-                if "\tdevice" in line:
-                    device_id = line.split("\t")[0]
-                    devices.append(device_id)
-
             self._close_operation_popup()
 
             if devices:
@@ -255,58 +263,57 @@ class ADBStatusWidget(QWidget):
                 self.connect_btn.setEnabled(True)
 
                 # Message de succès dans la status bar
-                if hasattr(self.parent(), "statusBar"):
-                    self.parent().statusBar().showMessage(
-                        f"✅ {len(devices)} appareil(s) détecté(s)", 2000
-                    )
+                self._show_status_message(
+                    f"✅ {len(devices)} appareil(s) détecté(s)", 2000
+                )
             else:
                 self.devices_combo.addItem("Aucun appareil détecté")
                 self.devices_combo.setEnabled(False)
                 self.connect_btn.setEnabled(False)
 
                 # Message d'info
-                if hasattr(self.parent(), "statusBar"):
-                    self.parent().statusBar().showMessage(
-                        "ℹ️ Aucun appareil Android détecté", 3000
-                    )
+                self._show_status_message("ℹ️ Aucun appareil Android détecté", 3000)
+        except Exception as e:
+            self._on_device_refresh_failed(e)
+        else:
+            self._finish_device_refresh()
 
-        except subprocess.TimeoutExpired:
+    def _on_device_refresh_failed(self, error: Exception):
+        """Gère l'échec de la recherche d'appareils."""
+        try:
             self._close_operation_popup()
-            logger.error("Timeout lors du rafraîchissement des appareils")
             self.devices_combo.clear()
-            self.devices_combo.addItem("⏱️ Timeout - Réessayez")
             self.devices_combo.setEnabled(False)
             self.connect_btn.setEnabled(False)
 
-            # Message dans la status bar seulement
-            if hasattr(self.parent(), "statusBar"):
-                self.parent().statusBar().showMessage(
+            if isinstance(error, subprocess.TimeoutExpired):
+                logger.error("Timeout lors du rafraîchissement des appareils")
+                self.devices_combo.addItem("⏱️ Timeout - Réessayez")
+
+                # Message dans la status bar seulement
+                self._show_status_message(
                     "⏱️ Timeout recherche d'appareils - Réessayez", 5000
                 )
-        except Exception as e:
-            self._close_operation_popup()
-            logger.error(f"Erreur lors du rafraîchissement des appareils: {e}")
-            self.devices_combo.clear()
-            self.devices_combo.addItem("❌ Erreur de détection")
-            self.devices_combo.setEnabled(False)
-            self.connect_btn.setEnabled(False)
+            else:
+                logger.error(f"Erreur lors du rafraîchissement des appareils: {error}")
+                self.devices_combo.addItem("❌ Erreur de détection")
 
-            # Message dans la status bar seulement
-            if hasattr(self.parent(), "statusBar"):
-                self.parent().statusBar().showMessage(
-                    f"❌ Erreur détection: {str(e)}", 5000
-                )
+                # Message dans la status bar seulement
+                self._show_status_message(f"❌ Erreur détection: {str(error)}", 5000)
         finally:
-            # Réactive les contrôles
-            self.refresh_btn.setEnabled(True)
-            # Le bouton connect dépend de s'il y a des appareils
-            if (
-                self.devices_combo.count() > 0
-                and self.devices_combo.currentText() != "Aucun appareil détecté"
-            ):
-                self.connect_btn.setEnabled(True)
-            else:
-                self.connect_btn.setEnabled(False)
+            self._finish_device_refresh()
+
+    def _finish_device_refresh(self):
+        """Réactive les contrôles après une recherche d'appareils."""
+        self.refresh_btn.setEnabled(True)
+        # Le bouton connect dépend de s'il y a des appareils
+        if (
+            self.devices_combo.count() > 0
+            and self.devices_combo.currentText() != "Aucun appareil détecté"
+        ):
+            self.connect_btn.setEnabled(True)
+        else:
+            self.connect_btn.setEnabled(False)
 
     def _toggle_connection(self):
         """Gère la connexion/déconnexion avec popup de feedback."""
@@ -342,7 +349,7 @@ class ADBStatusWidget(QWidget):
 
                     # Stocke l'appareil sélectionné et lance la connexion
                     self.adb_manager.current_device = selected_device
-                    QTimer.singleShot(300, self._perform_connection)
+                    self._perform_connection()
 
         except Exception as e:
             self._close_operation_popup()
@@ -350,20 +357,24 @@ class ADBStatusWidget(QWidget):
             self._handle_connection_error()
 
     def _perform_connection(self):
-        """Effectue la connexion à l'appareil."""
+        """Lance la connexion à l'appareil hors du thread GUI."""
+        task = BackgroundTask(self.adb_manager.connect)
+        task.signals.finished.connect(self._on_connection_finished)
+        task.signals.failed.connect(self._on_connection_failed)
+        task.start()
+
+    def _on_connection_finished(self, success: bool):
+        """Traite le résultat de la connexion à l'appareil."""
         try:
-            success = self.adb_manager.connect()
-
             if success:
                 # Connexion réussie
                 self._close_operation_popup()
                 self._update_ui(True)
 
                 # Message de succès dans la status bar seulement
-                if hasattr(self.parent(), "statusBar"):
-                    self.parent().statusBar().showMessage(
-                        f"✅ Connecté à {self.adb_manager.current_device}", 3000
-                    )
+                self._show_status_message(
+                    f"✅ Connecté à {self.adb_manager.current_device}", 3000
+                )
 
             else:
                 # Connexion échouée
@@ -371,10 +382,9 @@ class ADBStatusWidget(QWidget):
                 self._update_ui(False)
 
                 # Message d'erreur dans la status bar seulement
-                if hasattr(self.parent(), "statusBar"):
-                    self.parent().statusBar().showMessage(
-                        "❌ Échec de connexion - Vérifiez le débogage USB", 5000
-                    )
+                self._show_status_message(
+                    "❌ Échec de connexion - Vérifiez le débogage USB", 5000
+                )
 
         except Exception as e:
             self._close_operation_popup()
@@ -384,6 +394,15 @@ class ADBStatusWidget(QWidget):
             # Réactive les contrôles selon l'état
             self._restore_controls_state()
 
+    def _on_connection_failed(self, error: Exception):
+        """Gère une erreur survenue pendant la connexion."""
+        try:
+            self._close_operation_popup()
+            logger.error(f"Erreur lors de la connexion: {error}")
+            self._handle_connection_error()
+        finally:
+            self._restore_controls_state()
+
     def _perform_disconnection(self):
         """
         Effectue la déconnexion de l'appareil.
@@ -398,19 +417,13 @@ class ADBStatusWidget(QWidget):
             self._update_ui(False)
 
             # Message de déconnexion dans la status bar
-            if hasattr(self.parent(), "statusBar"):
-                self.parent().statusBar().showMessage(
-                    "✅ Appareil déconnecté - ADB actif", 2000
-                )
+            self._show_status_message("✅ Appareil déconnecté - ADB actif", 2000)
 
         except Exception as e:
             self._close_operation_popup()
             logger.error(f"Erreur lors de la déconnexion: {e}")
             # Message d'erreur dans la status bar seulement
-            if hasattr(self.parent(), "statusBar"):
-                self.parent().statusBar().showMessage(
-                    f"⚠️ Erreur de déconnexion: {str(e)}", 5000
-                )
+            self._show_status_message(f"⚠️ Erreur de déconnexion: {str(e)}", 5000)
         finally:
             self._restore_controls_state()
 
@@ -425,15 +438,15 @@ class ADBStatusWidget(QWidget):
     def _handle_connection_error(self):
         """Gère les erreurs de connexion avec qt-material."""
         try:
+            self._last_ui_state = None
             self.status_label.setText("❌ ERREUR")
             self.connect_btn.setText("Se connecter")
             self.device_info.clear()
 
             # Message d'erreur dans la status bar seulement
-            if hasattr(self.parent(), "statusBar"):
-                self.parent().statusBar().showMessage(
-                    "❌ Erreur de connexion - Vérifiez l'appareil", 5000
-                )
+            self._show_status_message(
+                "❌ Erreur de connexion - Vérifiez l'appareil", 5000
+            )
 
         except Exception as e:
             logger.error(f"Erreur lors de la gestion d'erreur de connexion: {e}")
@@ -441,6 +454,11 @@ class ADBStatusWidget(QWidget):
     def _update_ui(self, is_connected: bool):
         """Met à jour l'interface selon l'état de connexion avec qt-material."""
         try:
+            # État inchangé : on se contente de notifier
+            if self._last_ui_state == is_connected:
+                self.connection_changed.emit(is_connected)
+                return
+
             if is_connected:
                 # État connecté avec qt-material
                 self.status_label.setText("🟢 CONNECTÉ")
@@ -450,20 +468,11 @@ class ADBStatusWidget(QWidget):
 
                 self.devices_combo.setEnabled(False)
 
-                # Affichage des informations de l'appareil
-                try:
-                    if device_info := self.adb_manager.get_device_info():
-                        info_text = f"📱 {device_info['manufacturer']} {device_info['model']} (Android {device_info['android_version']})"
-                        self.device_info.setText(info_text)
-                        # qt-material gère la couleur automatiquement
-                except Exception as e:
-                    logger.error(
-                        f"Erreur lors de la récupération des infos appareil: {e}"
-                    )
-                    self.device_info.setText("⚠️ Erreur infos appareil")
+                # Affichage des informations de l'appareil (getprop hors thread GUI)
+                self._fetch_device_info()
 
-                # Démarrage du streaming automatique
-                if self.stream_window:
+                # Démarrage du streaming automatique (sauf si scrcpy tourne déjà)
+                if self.stream_window and not self.stream_window.is_running():
                     self.stream_window.start_stream()
 
             else:
@@ -480,6 +489,8 @@ class ADBStatusWidget(QWidget):
                 if self.stream_window:
                     self.stream_window.stop_stream()
 
+            self._last_ui_state = is_connected
+
             # Émission du signal de changement d'état
             self.connection_changed.emit(is_connected)
 
@@ -487,6 +498,33 @@ class ADBStatusWidget(QWidget):
             logger.error(f"Erreur lors de la mise à jour de l'interface: {e}")
             self._handle_ui_error()
 
+    def _fetch_device_info(self):
+        """Récupère les informations de l'appareil sans bloquer l'interface."""
+        task = BackgroundTask(self.adb_manager.get_device_info)
+        task.signals.finished.connect(self._on_device_info)
+        task.signals.failed.connect(self._on_device_info_failed)
+        task.start()
+
+    def _on_device_info(self, device_info):
+        """Affiche les informations de l'appareil connecté."""
+        # L'appareil a pu être déconnecté pendant la récupération
+        if not self.adb_manager.is_connected():
+            return
+
+        try:
+            if device_info:
+                info_text = f"📱 {device_info['manufacturer']} {device_info['model']} (Android {device_info['android_version']})"
+                self.device_info.setText(info_text)
+                # qt-material gère la couleur automatiquement
+        except Exception as e:
+            self._on_device_info_failed(e)
+
+    def _on_device_info_failed(self, error: Exception):
+        """Signale l'échec de récupération des informations appareil."""
+        logger.error(f"Erreur lors de la récupération des infos appareil: {error}")
+        if self.adb_manager.is_connected():
+            self.device_info.setText("⚠️ Erreur infos appareil")
+
     def _handle_stream_error(self, error_msg: str):
         """Gère les erreurs critiques du streaming - déconnexion automatique."""
         try:
@@ -512,10 +550,9 @@ class ADBStatusWidget(QWidget):
                 self._toggle_connection()
 
             # Message dans la status bar seulement
-            if hasattr(self.parent(), "statusBar"):
-                self.parent().statusBar().showMessage(
-                    "❌ Erreur de streaming - Appareil déconnecté", 5000
-                )
+            self._show_status_message(
+                "❌ Erreur de streaming - Appareil déconnecté", 5000
+            )
 
         except Exception as e:
             logger.error(f"Erreur lors du traitement de l'erreur de streaming: {e}")
@@ -550,10 +587,9 @@ class ADBStatusWidget(QWidget):
             self._perform_disconnection()
 
             # Message dans la status bar
-            if hasattr(self.parent(), "statusBar"):
-                self.parent().statusBar().showMessage(
-                    "🖼️ Fenêtre fermée - Reconnexion disponible", 3000
-                )
+            self._show_status_message(
+                "🖼️ Fenêtre fermée - Reconnexion disponible", 3000
+            )
 
         except Exception as e:
             logger.error(f"Erreur lors du traitement de la fermeture: {e}")
@@ -561,20 +597,19 @@ class ADBStatusWidget(QWidget):
     def _on_streaming_started(self):
         """Appelé quand le streaming démarre avec succès."""
         self._close_operation_popup()
-        if hasattr(self.parent(), "statusBar"):
-            self.parent().statusBar().showMessage("🎥 Prévisualisation démarrée", 2000)
+        self._show_status_message("🎥 Prévisualisation démarrée", 2000)
 
     def _on_streaming_stopped(self):
         """Appelé quand le streaming s'arrête."""
         self._close_operation_popup()
-        if hasattr(self.parent(), "statusBar"):
-            self.parent().statusBar().showMessage("🎥 Prévisualisation arrêtée", 2000)
+        self._show_status_message("🎥 Prévisualisation arrêtée", 2000)
 
     def _handle_ui_error(self):
         """Tente de récupérer après une erreur d'interface."""
         try:
             self._close_operation_popup()
 
+            self._last_ui_state = None
             self.status_label.setText("❌ ERREUR")
             self.connect_btn.setText("Se connecter")
             # Pas de setStyleSheet - qt-material s'en charge
@@ -1,7 +1,8 @@
 # src/ui/widgets/log_viewer.py
 
 from PyQt6.QtWidgets import QPlainTextEdit
-from PyQt6.QtGui import QColor, QPalette, QTextCursor
+from PyQt6.QtCore import QEvent, QObject, pyqtSignal
+from PyQt6.QtGui import QColor, QPalette, QTextCharFormat, QTextCursor
 
 
 
@@ -13,53 +14,98 @@ class ColoredLogViewer(QPlainTextEdit):
         self.setReadOnly(True)
         self.setMinimumHeight(100)
         self.document().setMaximumBlockCount(5000)  # Limite le nombre de lignes
+        # Journal en ajout seul : pas besoin de pile d'annulation
+        self.document().setUndoRedoEnabled(False)
+        self.setCenterOnScroll(False)
 
-    def append_log(self, message, level="INFO"):
-        cursor = self.textCursor()
-        format = self.currentCharFormat()
+        # Formats précalculés par niveau (évite une allocation par ligne)
+        self._fmts = {}
+        self._build_formats()
 
+    def _build_formats(self):
+        """Construit un QTextCharFormat par niveau de log."""
+        palette = self.palette()
         # qt-material ne gère pas automatiquement les couleurs de logs
         # donc on garde cette logique mais on utilise les couleurs du thème
-        if level == "DEBUG":
-            format.setForeground(
-                self.palette().color(QPalette.ColorRole.PlaceholderText)
-            )
-        elif level == "WARNING":
-            # Utilise une couleur orange compatible avec le thème
-            format.setForeground(QColor("#FF9800"))  # Material Orange
-        elif level == "ERROR" or level == "CRITICAL":
-            # Utilise une couleur rouge compatible avec le thème
-            format.setForeground(QColor("#F44336"))  # Material Red
-        else:  # INFO et autres
-            format.setForeground(self.palette().color(QPalette.ColorRole.Text))
+        colors = {
+            "DEBUG": palette.color(QPalette.ColorRole.PlaceholderText),
+            "INFO": palette.color(QPalette.ColorRole.Text),
+            "WARNING": QColor("#FF9800"),  # Material Orange
+            "ERROR": QColor("#F44336"),  # Material Red
+            "CRITICAL": QColor("#F44336"),  # Material Red
+        }
+
+        self._fmts = {}
+        for level, color in colors.items():
+            fmt = QTextCharFormat()
+            fmt.setForeground(color)
+            self._fmts[level] = fmt
+
+    def changeEvent(self, event):
+        """Recalcule les formats si la palette du thème change."""
+        if event.type() == QEvent.Type.PaletteChange:
+            self._build_formats()
+        super().changeEvent(event)
+
+    def append_log(self, message, level="INFO"):
+        cursor = self.textCursor()
+        # INFO et autres niveaux inconnus partagent le format par défaut
+        format = self._fmts.get(level, self._fmts["INFO"])
+
+        # Ne suit la fin que si l'utilisateur n'est pas remonté dans l'historique
+        scrollbar = self.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
 
         cursor.movePosition(QTextCursor.MoveOperation.End)
         cursor.insertText(f"{message}\n", format)
-        self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
+
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
 
     def load_initial_logs(self, buffer):
         """Charge les logs du buffer dans l'interface."""
         if buffer and hasattr(
             buffer, "logs"
         ):  # Vérifie si le buffer existe et a des logs
-            for message in buffer.logs:
-                self.append_log(message)
+            # Un seul setPlainText au lieu d'une insertion par ligne ;
+            # l'historique garde la couleur par défaut (comme avant).
+            # Les messages Loguru se terminent déjà par un retour à la ligne.
+            history = buffer.logs[-self.document().maximumBlockCount():]
+            self.setUpdatesEnabled(False)
+            try:
+                self.setPlainText("".join(history))
+
+                scrollbar = self.verticalScrollBar()
+                scrollbar.setValue(scrollbar.maximum())
+            finally:
+                self.setUpdatesEnabled(True)
+
+
+class _LogEmitter(QObject):
+    """Relaie les lignes de log vers le thread GUI."""
+
+    log_received = pyqtSignal(str, str)  # message, niveau
 
 
 class QtHandler:
-    """Handler personnalisé pour Loguru."""
+    """
+    Handler personnalisé pour Loguru (sink appelable).
+
+    Les logs peuvent venir des threads du QThreadPool : les lignes passent
+    par un signal, livré dans le thread du widget (connexion mise en file
+    d'attente), au lieu de modifier le widget depuis le thread appelant.
+    """
 
     def __init__(self, widget):
         self.widget = widget
+        self._emitter = _LogEmitter()
+        self._emitter.log_received.connect(widget.append_log)
 
-    def write(self, message):
+    def __call__(self, message):
         try:
-            # Extrait le niveau de log
-            level = "INFO"
-            for possible_level in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
-                if possible_level in message:
-                    level = possible_level
-                    break
-            self.widget.append_log(message.strip(), level)
+            # Le niveau est lu directement dans l'enregistrement Loguru
+            record = getattr(message, "record", None)
+            level = record["level"].name if record else "INFO"
+            self._emitter.log_received.emit(message.strip(), level)
         except Exception as e:
             print(f"Erreur dans le handler de log: {e}")
@@ -38,7 +38,11 @@ class OperationPopup(QDialog):
 	def update_message(self, message: str):
 		"""Met à jour le message affiché."""
 		self.message_label.setText(message)
-		# Force le rafraîchissement immédiat
+		# Rafraîchissement planifié : Qt regroupe les mises à jour successives
+		self.update()
+
+	def force_repaint(self):
+		"""Force un rafraîchissement immédiat (hors boucle d'événements)."""
 		self.repaint()
 
 	def close_popup(self):
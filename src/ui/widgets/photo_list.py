@@ -1,6 +1,7 @@
 # src/ui/widgets/photo_list.py
 
 from PyQt6.QtWidgets import (
+    QAbstractItemView,
     QWidget,
     QVBoxLayout,
     QLabel,
@@ -10,25 +11,40 @@ from PyQt6.QtWidgets import (
     QMenu,
     QMessageBox,
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QAction
+from PyQt6.QtCore import QFile, Qt, pyqtSignal
 from pathlib import Path
 from loguru import logger
+import bisect
 import os
 import subprocess
 import platform
+from typing import Callable
+
+
+class _PhotoQListWidget(QListWidget):
+    """QListWidget qui transmet les touches pressées à un callback après le traitement standard."""
+
+    def __init__(self, key_callback: Callable, parent=None):
+        super().__init__(parent)
+        self._key_callback = key_callback
+
+    def keyPressEvent(self, event):
+        super().keyPressEvent(event)
+        self._key_callback(event)
 
 
 class PhotoListWidget(QWidget):
     """Widget affichant la liste des photos avec actions de visualisation et suppression."""
 
     # Signal émis quand une photo est supprimée (pour rafraîchir les listes)
-    photo_deleted = pyqtSignal(str)  # nom du fichier supprimé
+    photo_deleted = pyqtSignal(str)  # nom(s) du/des fichier(s) supprimé(s), séparés par des virgules
 
     def __init__(self, title: str, photo_folder: Path = None, parent=None):
         super().__init__(parent)
         self.setMinimumHeight(150)
         self.photo_folder = photo_folder  # Dossier contenant les photos
+        self._sorted_names: list[str] = []  # Noms affichés, dans l'ordre de la liste
+        self._current_item = None  # Item courant, suivi via currentItemChanged
         self._setup_ui(title)
 
     def _setup_ui(self, title: str):
@@ -42,32 +58,80 @@ class PhotoListWidget(QWidget):
         layout.addWidget(title_label)
 
         # Liste des photos avec actions
-        self.photo_list = QListWidget()
+        self.photo_list = _PhotoQListWidget(self._handle_key_press)
         self.photo_list.setAlternatingRowColors(True)
+        self.photo_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.photo_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
 
         # Connecte les événements
         self.photo_list.customContextMenuRequested.connect(self._show_context_menu)
         self.photo_list.itemDoubleClicked.connect(self._view_photo)
-        self.photo_list.keyPressEvent = self._handle_key_press
+        self.photo_list.currentItemChanged.connect(self._on_current_item_changed)
 
         layout.addWidget(self.photo_list)
 
+        # Menu contextuel, construit une seule fois et réutilisé à chaque clic droit
+        self._context_item = None  # Item visé par le menu ouvert
+        self._context_menu = QMenu(self)
+
+        # Action Visualiser
+        self._view_action = self._context_menu.addAction("👁️ Visualiser")
+        self._view_action.triggered.connect(lambda: self._view_photo(self._context_item))
+
+        self._context_menu.addSeparator()
+
+        # Action Supprimer
+        self._delete_action = self._context_menu.addAction("🗑️ Supprimer")
+        self._delete_action.triggered.connect(
+            lambda: self._delete_selected_photos(self._context_item)
+        )
+
     def set_photo_folder(self, folder: Path):
         """Définit le dossier contenant les photos."""
         self.photo_folder = folder
 
     def update_photos(self, photos: list[str]):
-        """Met à jour la liste des photos."""
-        self.photo_list.clear()
-        for photo in sorted(photos):
-            item = QListWidgetItem(photo)
-            # Permet la sélection pour les actions
-            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsSelectable)
-            self.photo_list.addItem(item)
+        """
+        Met à jour la liste des photos.
+
+        Seules les différences avec la liste affichée sont appliquées : les
+        items des photos disparues sont retirés et les nouvelles photos
+        insérées à leur place dans l'ordre trié.
+        """
+        new_names = sorted(photos)
+        if new_names == self._sorted_names:
+            return
+
+        # Un seul rafraîchissement de la vue pour l'ensemble des modifications
+        self.photo_list.setUpdatesEnabled(False)
+        try:
+            # Retire les photos disparues (depuis la fin pour garder les indices valides)
+            new_set = set(new_names)
+            for row in range(len(self._sorted_names) - 1, -1, -1):
+                if self._sorted_names[row] not in new_set:
+                    del self._sorted_names[row]
+                    self.photo_list.takeItem(row)
+
+            # Insère les nouvelles photos à leur position triée
+            current_set = set(self._sorted_names)
+            for photo in new_names:
+                if photo not in current_set:
+                    row = bisect.bisect_left(self._sorted_names, photo)
+                    self._sorted_names.insert(row, photo)
+                    self.photo_list.insertItem(row, self._create_item(photo))
+        finally:
+            self.photo_list.setUpdatesEnabled(True)
+
+    def _create_item(self, photo: str) -> QListWidgetItem:
+        """Crée l'item de liste d'une photo."""
+        item = QListWidgetItem(photo)
+        # Permet la sélection pour les actions
+        item.setFlags(item.flags() | Qt.ItemFlag.ItemIsSelectable)
+        return item
 
     def clear(self):
         """Vide la liste des photos."""
+        self._sorted_names.clear()
         self.photo_list.clear()
 
     def _show_context_menu(self, position):
@@ -76,25 +140,12 @@ class PhotoListWidget(QWidget):
         if not item:
             return
 
-        photo_name = item.text()
-
-        # Crée le menu contextuel
-        menu = QMenu(self)
-
-        # Action Visualiser
-        view_action = QAction("👁️ Visualiser", self)
-        view_action.triggered.connect(lambda: self._view_photo(item))
-        menu.addAction(view_action)
-
-        menu.addSeparator()
-
-        # Action Supprimer
-        delete_action = QAction("🗑️ Supprimer", self)
-        delete_action.triggered.connect(lambda: self._delete_photo(item))
-        menu.addAction(delete_action)
-
         # Affiche le menu à la position de la souris
-        menu.exec(self.photo_list.mapToGlobal(position))
+        self._context_item = item
+        try:
+            self._context_menu.exec(self.photo_list.mapToGlobal(position))
+        finally:
+            self._context_item = None
 
     def _view_photo(self, item):
         """Ouvre la photo pour visualisation."""
@@ -104,24 +155,26 @@ class PhotoListWidget(QWidget):
         photo_name = item.text()
         photo_path = self.photo_folder / photo_name
 
-        if not photo_path.exists():
-            QMessageBox.warning(
-                self, "Photo introuvable", f"Le fichier {photo_name} n'existe pas."
-            )
-            return
-
         try:
             # Ouvre avec l'application par défaut du système
             if platform.system() == "Windows":
                 os.startfile(str(photo_path))
             elif platform.system() == "Darwin":  # macOS
-                subprocess.run(["open", str(photo_path)])
+                subprocess.run(["open", str(photo_path)], check=True)
             else:  # Linux
-                subprocess.run(["xdg-open", str(photo_path)])
+                subprocess.run(["xdg-open", str(photo_path)], check=True)
 
             logger.info(f"Photo ouverte : {photo_name}")
 
         except Exception as e:
+            # Vérifie l'existence seulement en cas d'échec : une erreur peut aussi
+            # venir d'un lanceur (open/xdg-open) absent ou en échec
+            if not photo_path.exists():
+                QMessageBox.warning(
+                    self, "Photo introuvable", f"Le fichier {photo_name} n'existe pas."
+                )
+                return
+
             logger.error(f"Erreur lors de l'ouverture de {photo_name}: {e}")
             QMessageBox.warning(
                 self,
@@ -130,67 +183,105 @@ class PhotoListWidget(QWidget):
                 f"Vérifiez qu'une application de visualisation d'images est installée.",
             )
 
-    def _delete_photo(self, item):
-        """Supprime la photo après confirmation."""
-        if not item or not self.photo_folder:
-            return
+    def _delete_selected_photos(self, item=None):
+        """
+        Supprime les photos sélectionnées.
 
-        photo_name = item.text()
-        photo_path = self.photo_folder / photo_name
+        Si l'item visé ne fait pas partie de la sélection, seul cet item est supprimé.
+        """
+        items = self.photo_list.selectedItems()
+        if item is not None and item not in items:
+            items = [item]
+        self._delete_photos(items)
 
-        if not photo_path.exists():
-            QMessageBox.warning(
-                self, "Photo introuvable", f"Le fichier {photo_name} n'existe pas."
-            )
+    def _delete_photos(self, items: list[QListWidgetItem]):
+        """Déplace un lot de photos vers la corbeille après une confirmation unique."""
+        if not items or not self.photo_folder:
             return
 
-        # Demande confirmation
+        # Demande confirmation (une seule fois pour tout le lot)
+        if len(items) == 1:
+            question = (
+                f"Êtes-vous sûr de vouloir supprimer la photo ?\n\n"
+                f"📁 {items[0].text()}\n\n"
+                f"🗑️ La photo sera déplacée vers la corbeille."
+            )
+        else:
+            question = (
+                f"Êtes-vous sûr de vouloir supprimer {len(items)} photos ?\n\n"
+                f"🗑️ Les photos seront déplacées vers la corbeille."
+            )
         reply = QMessageBox.question(
             self,
             "Confirmer la suppression",
-            f"Êtes-vous sûr de vouloir supprimer la photo ?\n\n"
-            f"📁 {photo_name}\n\n"
-            f"⚠️ Cette action est irréversible.",
+            question,
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             QMessageBox.StandardButton.No,
         )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
 
-        if reply == QMessageBox.StandardButton.Yes:
+        deleted_rows = []
+        missing = []
+        errors = []
+        for item in items:
+            photo_name = item.text()
+            photo_path = self.photo_folder / photo_name
             try:
-                # Supprime le fichier
-                photo_path.unlink()
+                # Déplace le fichier vers la corbeille (récupérable par l'utilisateur)
+                moved, _ = QFile.moveToTrash(str(photo_path))
+                if not moved:
+                    # Vérifie l'existence seulement en cas d'échec
+                    if not photo_path.exists():
+                        raise FileNotFoundError(photo_name)
+                    raise OSError("déplacement vers la corbeille impossible")
+                deleted_rows.append(self.photo_list.row(item))
+                logger.info(f"Photo déplacée vers la corbeille : {photo_name}")
+            except FileNotFoundError:
+                logger.warning(f"Photo introuvable : {photo_name}")
+                missing.append(photo_name)
+            except Exception as e:
+                logger.error(f"Erreur lors de la suppression de {photo_name}: {e}")
+                errors.append(f"{photo_name} : {e}")
 
-                # Supprime l'item de la liste
-                row = self.photo_list.row(item)
-                self.photo_list.takeItem(row)
+        # Supprime les items de la liste (depuis la fin pour garder les indices valides)
+        deleted_names = []
+        for row in sorted(deleted_rows, reverse=True):
+            self.photo_list.takeItem(row)
+            deleted_names.insert(0, self._sorted_names.pop(row))
 
-                # Émet le signal pour informer de la suppression
-                self.photo_deleted.emit(photo_name)
+        # Émet le signal une seule fois pour tout le lot
+        if deleted_names:
+            self.photo_deleted.emit(", ".join(deleted_names))
 
-                logger.info(f"Photo supprimée : {photo_name}")
+        if missing:
+            QMessageBox.warning(
+                self,
+                "Photo introuvable",
+                "Fichier(s) inexistant(s) :\n" + "\n".join(missing),
+            )
 
-            except Exception as e:
-                logger.error(f"Erreur lors de la suppression de {photo_name}: {e}")
-                QMessageBox.critical(
-                    self,
-                    "Erreur de suppression",
-                    f"Impossible de supprimer la photo {photo_name}.\n\n"
-                    f"Erreur : {str(e)}",
-                )
+        if errors:
+            QMessageBox.critical(
+                self,
+                "Erreur de suppression",
+                "Impossible de supprimer certaines photos.\n\n" + "\n".join(errors),
+            )
 
-    def _handle_key_press(self, event):
-        """Gère les raccourcis clavier dans la liste."""
-        # Appel de la méthode parente d'abord
-        QListWidget.keyPressEvent(self.photo_list, event)
+    def _on_current_item_changed(self, current, previous):
+        """Mémorise l'item courant pour les raccourcis clavier."""
+        self._current_item = current
 
-        # Gestion de la touche Suppr
+    def _handle_key_press(self, event):
+        """Gère les raccourcis clavier dans la liste (après le traitement standard)."""
+        # Gestion de la touche Suppr (toute la sélection, sinon l'item courant)
         if event.key() == Qt.Key.Key_Delete:
-            current_item = self.photo_list.currentItem()
-            if current_item:
-                self._delete_photo(current_item)
+            if self.photo_list.selectedItems():
+                self._delete_selected_photos()
+            elif self._current_item:
+                self._delete_photos([self._current_item])
 
         # Gestion de la touche Entrée pour visualiser
         elif event.key() in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
-            current_item = self.photo_list.currentItem()
-            if current_item:
-                self._view_photo(current_item)
+            if self._current_item:
+                self._view_photo(self._current_item)
@@ -1,7 +1,7 @@
 import sys
-import threading
+from typing import Optional
 
-from PyQt6.QtCore import QProcess, pyqtSignal, QObject
+from PyQt6.QtCore import QProcess, QTimer, pyqtSignal, pyqtSlot, QObject
 from pathlib import Path
 from loguru import logger
 
@@ -25,6 +25,25 @@ class StreamWindow(QObject):
     # Signal émis en cas d'erreur critique nécessitant une déconnexion
     critical_error = pyqtSignal(str)
 
+    # Options fixes de scrcpy (le numéro de série est ajouté au lancement)
+    _BASE_ARGS = [
+        "--window-title",
+        "Prévisualisation Android",
+        "--window-width",
+        "400",
+        "--window-height",
+        "800",
+        "--render-driver",
+        "software",
+        "--stay-awake",
+        "--always-on-top",
+    ]
+
+    # Chemin de scrcpy (et son dossier) résolu au premier lancement,
+    # partagé entre les instances
+    _cached_scrcpy_path: Optional[str] = None
+    _cached_scrcpy_dir: Optional[str] = None
+
     def __init__(self, adb_manager, parent):
         """
         Initialise le gestionnaire de streaming.
@@ -38,10 +57,15 @@ class StreamWindow(QObject):
             self.adb_manager = adb_manager
             self.parent = parent
             self.scrcpy_process = None
-            self._stopping_manually = False
 
-            # Verrou thread-safe pour éviter les lancements multiples
-            self._start_lock = threading.Lock()
+            # Délai maximal de démarrage de scrcpy (sans bloquer l'interface)
+            self._start_timer = QTimer(self)
+            self._start_timer.setSingleShot(True)
+            self._start_timer.setInterval(5000)
+            self._start_timer.timeout.connect(self._on_start_timeout)
+
+            # Drapeau anti-réentrance (start_stream n'est appelé que depuis le thread GUI)
+            self._starting = False
 
         except Exception as e:
             logger.error(f"Erreur lors de l'initialisation de StreamWindow: {e}")
@@ -50,16 +74,18 @@ class StreamWindow(QObject):
     def start_stream(self):
         """
         Démarre le streaming dans une fenêtre scrcpy.
-        Thread-safe pour éviter les lancements multiples.
-        Émet des signaux pour le feedback utilisateur.
+        Protégé contre les lancements multiples (appel depuis le thread GUI).
+        Émet des signaux pour le feedback utilisateur : le démarrage effectif
+        est signalé par started, un échec ou un délai dépassé par critical_error.
 
         Returns:
-            bool: True si le démarrage réussit, False sinon
+            bool: True si le lancement est engagé, False sinon
         """
-        # Acquisition non-bloquante du verrou
-        if not self._start_lock.acquire(blocking=False):
+        # Ignore un appel réentrant (ex. slot déclenché pendant le démarrage)
+        if self._starting:
             logger.warning("Démarrage déjà en cours, requête ignorée")
             return False
+        self._starting = True
 
         try:
             logger.debug("====== Démarrage stream ======")
@@ -76,50 +102,31 @@ class StreamWindow(QObject):
             # Arrêt de tout processus existant
             self.stop_stream()
 
-            # Obtention du chemin scrcpy avec gestion d'erreur
+            # Seuls la recherche de scrcpy et le lancement du processus peuvent échouer
             try:
                 scrcpy_path = self._get_scrcpy_path()
-            except FileNotFoundError as e:
-                logger.error(f"Configuration scrcpy invalide: {e}")
-                self.critical_error.emit("scrcpy introuvable")
-                return False
 
-            # Création et configuration du processus
-            try:
+                # Création et configuration du processus
                 self.scrcpy_process = QProcess(self.parent)
+                self.scrcpy_process.started.connect(self._on_process_started)
                 self.scrcpy_process.finished.connect(self._on_process_finished)
                 self.scrcpy_process.errorOccurred.connect(self._on_process_error)
 
                 # Configuration des arguments
-                args = [
-                    "--window-title",
-                    "Prévisualisation Android",
-                    "--window-width",
-                    "400",
-                    "--window-height",
-                    "800",
-                    "--render-driver",
-                    "software",
-                    "--stay-awake",
-                    "--serial",
-                    self.adb_manager.current_device,
-                    "--always-on-top",
-                ]
+                args = StreamWindow._BASE_ARGS + ["--serial", self.adb_manager.current_device]
 
                 # Configuration du répertoire de travail
-                working_dir = Path(scrcpy_path).parent
-                self.scrcpy_process.setWorkingDirectory(str(working_dir))
+                working_dir = StreamWindow._cached_scrcpy_dir
+                self.scrcpy_process.setWorkingDirectory(working_dir)
 
-                # Démarrage avec surveillance du timeout
+                # Démarrage avec surveillance du timeout (confirmé par _on_process_started)
                 logger.debug(f"Lancement de scrcpy depuis {working_dir}")
-                self.scrcpy_process.start(str(scrcpy_path), args)
-
-                if not self.scrcpy_process.waitForStarted(5000):
-                    raise TimeoutError("Timeout lors du démarrage de scrcpy")
+                self.scrcpy_process.start(scrcpy_path, args)
 
-                logger.info("Streaming démarré avec succès")
-                self.started.emit()  # Signal de succès
-                return True
+            except FileNotFoundError as e:
+                logger.error(f"Configuration scrcpy invalide: {e}")
+                self.critical_error.emit("scrcpy introuvable")
+                return False
 
             except Exception as e:
                 logger.error(f"Erreur lors du démarrage du processus: {e}")
@@ -127,50 +134,91 @@ class StreamWindow(QObject):
                 self.critical_error.emit(str(e))
                 return False
 
-        except Exception as e:
-            logger.error(f"Erreur inattendue lors du démarrage du stream: {e}")
-            self.critical_error.emit(f"Erreur inattendue: {str(e)}")
-            return False
+            self._start_timer.start()
+            return True
 
         finally:
-            # Libération du verrou dans tous les cas
-            self._start_lock.release()
+            # Libération du drapeau dans tous les cas
+            self._starting = False
 
     def stop_stream(self):
         """
-        Arrête proprement le streaming en cours.
-        Thread-safe. Émet des signaux pour le feedback utilisateur.
+        Arrête le streaming en cours sans bloquer l'interface.
+        Émet des signaux pour le feedback utilisateur.
+
+        Le processus reçoit une demande d'arrêt, puis est tué s'il ne s'est
+        pas terminé après 3 secondes. Le signal stopped est émis à sa fin effective.
         """
         if self.scrcpy_process is not None:
             try:
                 logger.debug("Arrêt du stream demandé")
                 self.stopping.emit()  # Signal d'arrêt en cours
-                self._stopping_manually = True
+                self._start_timer.stop()
 
                 # Garde une référence locale pour le nettoyage
                 process = self.scrcpy_process
                 self.scrcpy_process = None
 
-                process.terminate()
-                if not process.waitForFinished(3000):
-                    logger.warning("Le processus ne répond pas, arrêt forcé")
-                    process.kill()
-                    process.waitForFinished(1000)
+                # La fin de ce processus est demandée : elle ne doit plus être
+                # traitée comme une fermeture par l'utilisateur ou une erreur
+                process.started.disconnect(self._on_process_started)
+                process.finished.disconnect(self._on_process_finished)
+                process.errorOccurred.disconnect(self._on_process_error)
+
+                if process.state() == QProcess.ProcessState.NotRunning:
+                    self._on_stream_process_stopped(process)
+                    return
+
+                process.finished.connect(
+                    lambda *_: self._on_stream_process_stopped(process)
+                )
 
-                process.deleteLater()
-                logger.info("Streaming arrêté avec succès")
-                self.stopped.emit()  # Signal d'arrêt réussi
+                # Arrêt forcé si le processus ne répond pas (minuteur détruit avec lui)
+                kill_timer = QTimer(process)
+                kill_timer.setSingleShot(True)
+                kill_timer.timeout.connect(lambda: self._force_kill(process))
+                kill_timer.start(3000)
+
+                process.terminate()
 
             except Exception as e:
                 logger.error(f"Erreur lors de l'arrêt du stream: {e}")
                 self.critical_error.emit(f"Erreur d'arrêt: {str(e)}")
-            finally:
-                self._stopping_manually = False
 
+    def _force_kill(self, process):
+        """Tue un processus scrcpy qui n'a pas répondu à la demande d'arrêt."""
+        logger.warning("Le processus ne répond pas, arrêt forcé")
+        process.kill()
+
+    def _on_stream_process_stopped(self, process):
+        """Nettoie un processus scrcpy arrêté à la demande."""
+        process.deleteLater()
+        logger.info("Streaming arrêté avec succès")
+        self.stopped.emit()  # Signal d'arrêt réussi
+
+    @pyqtSlot()
+    def _on_process_started(self):
+        """Appelé quand le processus scrcpy a effectivement démarré."""
+        self._start_timer.stop()
+        logger.info("Streaming démarré avec succès")
+        self.started.emit()  # Signal de succès
+
+    @pyqtSlot()
+    def _on_start_timeout(self):
+        """Abandonne un démarrage de scrcpy qui n'aboutit pas dans le délai."""
+        error_msg = "Timeout lors du démarrage de scrcpy"
+        logger.error(f"Erreur lors du démarrage du processus: {error_msg}")
+        self.stop_stream()
+        self.critical_error.emit(error_msg)
+
+    @pyqtSlot(int, QProcess.ExitStatus)
     def _on_process_finished(self, exit_code, exit_status):
         """
         Gère la fin du processus scrcpy en distinguant les différents cas de sortie.
 
+        Seules les fins non demandées arrivent ici : stop_stream() déconnecte
+        ce slot avant d'arrêter le processus.
+
         Les codes de sortie de scrcpy :
         0 : Sortie normale (fenêtre fermée par l'utilisateur)
         1 : Erreur d'initialisation
@@ -187,11 +235,7 @@ class StreamWindow(QObject):
                 self.scrcpy_process = None
 
             # Analyse du code de sortie
-            if self._stopping_manually:
-                # Si l'arrêt était demandé, pas d'action particulière nécessaire
-                logger.debug("Arrêt normal du streaming")
-                # Le signal stopped a déjà été émis dans stop_stream()
-            elif exit_code == 0:
+            if exit_code == 0:
                 # Fermeture normale par l'utilisateur
                 logger.debug("Fenêtre fermée par l'utilisateur")
                 self.stopped.emit()  # Signal d'arrêt
@@ -201,7 +245,7 @@ class StreamWindow(QObject):
                 error_msg = "Erreur d'initialisation de scrcpy"
                 logger.error(error_msg)
                 self.critical_error.emit(error_msg)
-            elif not self._stopping_manually:
+            else:
                 # Autres codes d'erreur non attendus
                 error_msg = f"Erreur inattendue de scrcpy (code {exit_code})"
                 logger.error(error_msg)
@@ -210,6 +254,7 @@ class StreamWindow(QObject):
         except Exception as e:
             logger.error(f"Erreur lors du traitement de fin de processus: {e}")
 
+    @pyqtSlot(QProcess.ProcessError)
     def _on_process_error(self, error):
         """Gère les erreurs du processus scrcpy et arrête proprement le streaming."""
         try:
@@ -224,7 +269,16 @@ class StreamWindow(QObject):
     def _get_scrcpy_path(self):
         """
         Détermine le chemin de l'exécutable scrcpy de manière sécurisée.
+
+        Le chemin trouvé est mémorisé : les lancements suivants ne refont pas
+        la recherche tant que l'exécutable existe toujours.
         """
+        cached = StreamWindow._cached_scrcpy_path
+        if cached and Path(cached).exists():
+            return cached
+        StreamWindow._cached_scrcpy_path = None
+        StreamWindow._cached_scrcpy_dir = None
+
         try:
             if getattr(sys, "frozen", False):
                 # Si nous sommes dans un exe compilé
@@ -240,15 +294,17 @@ class StreamWindow(QObject):
             if not scrcpy_path.exists():
                 raise FileNotFoundError(f"scrcpy.exe non trouvé à {scrcpy_path}")
 
-            return str(scrcpy_path)
+            StreamWindow._cached_scrcpy_path = str(scrcpy_path)
+            StreamWindow._cached_scrcpy_dir = str(scrcpy_path.parent)
+            return StreamWindow._cached_scrcpy_path
 
         except Exception as e:
             logger.error(f"Erreur lors de la recherche de scrcpy: {e}")
             raise
 
     def is_running(self):
-        """Vérifie si le streaming est en cours."""
+        """Vérifie si le streaming est en cours (ou en cours de démarrage)."""
         return (
             self.scrcpy_process is not None
-            and self.scrcpy_process.state() == QProcess.ProcessState.Running
+            and self.scrcpy_process.state() != QProcess.ProcessState.NotRunning
         )
@@ -4,14 +4,145 @@
 Gestionnaire d'erreurs avec messages utilisateur conviviaux.
 """
 
-from typing import Tuple
+import re
+from typing import Dict, Optional, Pattern, Tuple
 from loguru import logger
 import subprocess
 
 
+def _first_match(pattern: Pattern, error_str: str, priority: Dict[str, Tuple[str, str]]) -> Optional[str]:
+    """
+    Recherche les mots-clés d'erreur en une seule passe.
+
+    Args:
+            pattern: Expression régulière à groupes nommés (un groupe par cas)
+            error_str: Message d'erreur en minuscules
+            priority: Messages par groupe, dans l'ordre de priorité
+
+    Returns:
+            Optional[str]: Nom du groupe trouvé le plus prioritaire, ou None
+    """
+    found = {match.lastgroup for match in pattern.finditer(error_str)}
+    if not found:
+        return None
+    return next(key for key in priority if key in found)
+
+
 class UserFriendlyErrorHandler:
     """Convertit les erreurs techniques en messages utilisateur clairs."""
 
+    # Mots-clés reconnus, un groupe nommé par cas (l'ordre des messages fait foi)
+    _ADB_ERROR_RE = re.compile(
+        r"(?P<timeout>timeout)"
+        r"|(?P<device_not_found>device not found|no devices)"
+        r"|(?P<permission>permission denied)"
+        r"|(?P<no_such_file>no such file)"
+    )
+    _FILE_ERROR_RE = re.compile(
+        r"(?P<permission>permission denied|access is denied)"
+        r"|(?P<exists>file exists|already exists)"
+        r"|(?P<no_space>no space left)"
+        r"|(?P<not_found>not found)"
+    )
+    _SCRCPY_ERROR_RE = re.compile(
+        r"(?P<not_found>scrcpy introuvable|not found)"
+        r"|(?P<timeout>timeout)"
+    )
+
+    # Messages par cas, dans l'ordre de priorité
+    _ADB_MESSAGES = {
+        "timeout": (
+            "Appareil non réactif",
+            "L'appareil Android ne répond pas.\n\n"
+            "Solutions :\n"
+            "• Vérifiez que l'appareil est déverrouillé\n"
+            "• Débranchez et rebranchez le câble USB\n"
+            "• Redémarrez l'appareil si nécessaire",
+        ),
+        "device_not_found": (
+            "Appareil introuvable",
+            "Aucun appareil Android détecté.\n\n"
+            "Solutions :\n"
+            "• Vérifiez que le câble USB est bien connecté\n"
+            "• Activez le débogage USB dans les options développeur\n"
+            "• Autorisez la connexion sur l'appareil\n"
+            "• Cliquez sur 'Rafraîchir' pour rechercher à nouveau",
+        ),
+        "permission": (
+            "Accès refusé",
+            "L'accès à l'appareil est refusé.\n\n"
+            "Solutions :\n"
+            "• Autorisez la connexion de débogage sur l'appareil\n"
+            "• Vérifiez que le mode développeur est activé\n"
+            "• Redémarrez la connexion ADB",
+        ),
+        "no_such_file": (
+            "Photo introuvable",
+            "La photo n'a pas pu être trouvée sur l'appareil.\n\n"
+            "Solutions :\n"
+            "• Vérifiez que la photo a bien été prise\n"
+            "• Attendez quelques secondes et réessayez\n"
+            "• Ouvrez l'appareil photo pour vérifier",
+        ),
+    }
+
+    # Les messages contenant {file_path} sont complétés avec le chemin concerné
+    _FILE_MESSAGES = {
+        "permission": (
+            "Accès au fichier refusé",
+            "Impossible d'accéder au dossier.\n\n"
+            "Chemin : {file_path}\n\n"
+            "Solutions :\n"
+            "• Vérifiez que le dossier n'est pas en lecture seule\n"
+            "• Fermez les applications qui utilisent ce dossier\n"
+            "• Exécutez en tant qu'administrateur si nécessaire",
+        ),
+        "exists": (
+            "Fichier déjà existant",
+            "Un dossier avec ce nom existe déjà.\n\n"
+            "Solutions :\n"
+            "• Choisissez un nom différent\n"
+            "• Supprimez le dossier existant si nécessaire\n"
+            "• Ajoutez un suffixe au nom (ex: _2)",
+        ),
+        "no_space": (
+            "Espace disque insuffisant",
+            "Plus d'espace disponible sur le disque.\n\n"
+            "Solutions :\n"
+            "• Libérez de l'espace disque\n"
+            "• Choisissez un autre emplacement\n"
+            "• Supprimez des fichiers temporaires",
+        ),
+        "not_found": (
+            "Dossier introuvable",
+            "Le dossier spécifié n'existe pas.\n\n"
+            "Chemin : {file_path}\n\n"
+            "Solutions :\n"
+            "• Vérifiez que le chemin est correct\n"
+            "• Reconfigurer le dossier de travail\n"
+            "• Créez le dossier manuellement",
+        ),
+    }
+
+    _SCRCPY_MESSAGES = {
+        "not_found": (
+            "Scrcpy non trouvé",
+            "L'outil de streaming n'est pas disponible.\n\n"
+            "Solutions :\n"
+            "• Vérifiez l'installation de scrcpy\n"
+            "• Redémarrez l'application\n"
+            "• Réinstallez si nécessaire",
+        ),
+        "timeout": (
+            "Délai d'attente dépassé",
+            "Le streaming n'a pas pu se lancer.\n\n"
+            "Solutions :\n"
+            "• Vérifiez la connexion de l'appareil\n"
+            "• Redémarrez la connexion ADB\n"
+            "• Réessayez dans quelques instants",
+        ),
+    }
+
     @staticmethod
     def handle_adb_error(exception: Exception, operation: str = "") -> Tuple[str, str]:
         """
@@ -26,46 +157,13 @@ class UserFriendlyErrorHandler:
         """
         error_str = str(exception).lower()
 
-        if "timeout" in error_str:
-            return (
-                "Appareil non réactif",
-                "L'appareil Android ne répond pas.\n\n"
-                "Solutions :\n"
-                "• Vérifiez que l'appareil est déverrouillé\n"
-                "• Débranchez et rebranchez le câble USB\n"
-                "• Redémarrez l'appareil si nécessaire",
-            )
-
-        if "device not found" in error_str or "no devices" in error_str:
-            return (
-                "Appareil introuvable",
-                "Aucun appareil Android détecté.\n\n"
-                "Solutions :\n"
-                "• Vérifiez que le câble USB est bien connecté\n"
-                "• Activez le débogage USB dans les options développeur\n"
-                "• Autorisez la connexion sur l'appareil\n"
-                "• Cliquez sur 'Rafraîchir' pour rechercher à nouveau",
-            )
-
-        if "permission denied" in error_str:
-            return (
-                "Accès refusé",
-                "L'accès à l'appareil est refusé.\n\n"
-                "Solutions :\n"
-                "• Autorisez la connexion de débogage sur l'appareil\n"
-                "• Vérifiez que le mode développeur est activé\n"
-                "• Redémarrez la connexion ADB",
-            )
-
-        if "no such file" in error_str:
-            return (
-                "Photo introuvable",
-                "La photo n'a pas pu être trouvée sur l'appareil.\n\n"
-                "Solutions :\n"
-                "• Vérifiez que la photo a bien été prise\n"
-                "• Attendez quelques secondes et réessayez\n"
-                "• Ouvrez l'appareil photo pour vérifier",
-            )
+        key = _first_match(
+            UserFriendlyErrorHandler._ADB_ERROR_RE,
+            error_str,
+            UserFriendlyErrorHandler._ADB_MESSAGES,
+        )
+        if key:
+            return UserFriendlyErrorHandler._ADB_MESSAGES[key]
 
         # Erreur générique
         return (
@@ -92,47 +190,14 @@ class UserFriendlyErrorHandler:
         """
         error_str = str(exception).lower()
 
-        if "permission denied" in error_str or "access is denied" in error_str:
-            return (
-                "Accès au fichier refusé",
-                f"Impossible d'accéder au dossier.\n\n"
-                f"Chemin : {file_path}\n\n"
-                f"Solutions :\n"
-                f"• Vérifiez que le dossier n'est pas en lecture seule\n"
-                f"• Fermez les applications qui utilisent ce dossier\n"
-                f"• Exécutez en tant qu'administrateur si nécessaire",
-            )
-
-        if "file exists" in error_str or "already exists" in error_str:
-            return (
-                "Fichier déjà existant",
-                f"Un dossier avec ce nom existe déjà.\n\n"
-                f"Solutions :\n"
-                f"• Choisissez un nom différent\n"
-                f"• Supprimez le dossier existant si nécessaire\n"
-                f"• Ajoutez un suffixe au nom (ex: _2)",
-            )
-
-        if "no space left" in error_str:
-            return (
-                "Espace disque insuffisant",
-                f"Plus d'espace disponible sur le disque.\n\n"
-                f"Solutions :\n"
-                f"• Libérez de l'espace disque\n"
-                f"• Choisissez un autre emplacement\n"
-                f"• Supprimez des fichiers temporaires",
-            )
-
-        if "not found" in error_str:
-            return (
-                "Dossier introuvable",
-                f"Le dossier spécifié n'existe pas.\n\n"
-                f"Chemin : {file_path}\n\n"
-                f"Solutions :\n"
-                f"• Vérifiez que le chemin est correct\n"
-                f"• Reconfigurer le dossier de travail\n"
-                f"• Créez le dossier manuellement",
-            )
+        key = _first_match(
+            UserFriendlyErrorHandler._FILE_ERROR_RE,
+            error_str,
+            UserFriendlyErrorHandler._FILE_MESSAGES,
+        )
+        if key:
+            title, message = UserFriendlyErrorHandler._FILE_MESSAGES[key]
+            return title, message.replace("{file_path}", str(file_path))
 
         # Erreur générique
         return (
@@ -155,25 +220,13 @@ class UserFriendlyErrorHandler:
         """
         error_str = str(exception).lower()
 
-        if "scrcpy introuvable" in error_str or "not found" in error_str:
-            return (
-                "Scrcpy non trouvé",
-                "L'outil de streaming n'est pas disponible.\n\n"
-                "Solutions :\n"
-                "• Vérifiez l'installation de scrcpy\n"
-                "• Redémarrez l'application\n"
-                "• Réinstallez si nécessaire",
-            )
-
-        if "timeout" in error_str:
-            return (
-                "Délai d'attente dépassé",
-                "Le streaming n'a pas pu se lancer.\n\n"
-                "Solutions :\n"
-                "• Vérifiez la connexion de l'appareil\n"
-                "• Redémarrez la connexion ADB\n"
-                "• Réessayez dans quelques instants",
-            )
+        key = _first_match(
+            UserFriendlyErrorHandler._SCRCPY_ERROR_RE,
+            error_str,
+            UserFriendlyErrorHandler._SCRCPY_MESSAGES,
+        )
+        if key:
+            return UserFriendlyErrorHandler._SCRCPY_MESSAGES[key]
 
         # Erreur générique scrcpy
         return (
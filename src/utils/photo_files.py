@@ -0,0 +1,31 @@
+# src/utils/photo_files.py
+
+"""
+Énumération des photos d'un dossier de scellé.
+
+Règle commune à toute l'application : extension .jpg sans tenir compte de la
+casse, fichiers uniquement. Comme Path.glob("*.jpg"), les noms commençant
+par un point sont conservés.
+"""
+
+import os
+from pathlib import Path
+from typing import List
+
+
+def list_photos(folder: Path) -> List[str]:
+    """
+    Liste les noms des photos JPEG d'un dossier (non triés).
+
+    os.scandir fournit le type de chaque entrée lors du parcours, sans appel
+    stat supplémentaire par fichier. Un dossier absent donne une liste vide.
+    """
+    try:
+        with os.scandir(folder) as entries:
+            return [
+                entry.name
+                for entry in entries
+                if entry.name.lower().endswith(".jpg") and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
@@ -12,8 +12,11 @@ class FilenameValidator:
     # Caractères interdits sur Windows
     FORBIDDEN_CHARS = '<>:"/\\|?*'
 
+    # Caractères interdits ou de contrôle, recherchés en une seule passe
+    _INVALID_RE = re.compile(f"[{re.escape(FORBIDDEN_CHARS)}\\x00-\\x1f]")
+
     # Noms réservés Windows (insensible à la casse)
-    RESERVED_NAMES = {
+    RESERVED_NAMES = frozenset({
         "CON",
         "PRN",
         "AUX",
@@ -36,7 +39,7 @@ class FilenameValidator:
         "LPT7",
         "LPT8",
         "LPT9",
-    }
+    })
 
     # Longueur maximale recommandée (Windows limite à 255, on garde une marge)
     MAX_LENGTH = 200
@@ -64,31 +67,34 @@ class FilenameValidator:
         if name != name_clean:
             return False, "Le nom ne peut pas commencer ou finir par des espaces"
 
+        # Recherche en une passe des caractères interdits ou de contrôle ;
+        # le détail n'est calculé que si un caractère invalide est présent
+        has_invalid = cls._INVALID_RE.search(name) is not None
+
         # Vérifie les caractères interdits
-        forbidden_found = [char for char in cls.FORBIDDEN_CHARS if char in name]
-        if forbidden_found:
-            return False, f"Caractères interdits trouvés : {', '.join(forbidden_found)}"
+        if has_invalid:
+            forbidden_found = [char for char in cls.FORBIDDEN_CHARS if char in name]
+            if forbidden_found:
+                return False, f"Caractères interdits trouvés : {', '.join(forbidden_found)}"
 
         # Vérifie la longueur
         if len(name) > cls.MAX_LENGTH:
             return False, f"Le nom est trop long (max {cls.MAX_LENGTH} caractères)"
 
-        # Vérifie les noms réservés Windows
+        # Vérifie les noms réservés Windows, avec ou sans extension
         name_upper = name.upper()
-        if name_upper in cls.RESERVED_NAMES:
-            return False, f"'{name}' est un nom réservé Windows"
-
-        # Vérifie les noms réservés avec extension
-        name_base = name_upper.split(".")[0]
+        name_base = name_upper.partition(".")[0]
         if name_base in cls.RESERVED_NAMES:
+            if name_base == name_upper:
+                return False, f"'{name}' est un nom réservé Windows"
             return False, f"'{name}' utilise un nom réservé Windows"
 
         # Vérifie qu'il ne finit pas par un point ou un espace (problématique sur Windows)
         if name.endswith(".") or name.endswith(" "):
             return False, "Le nom ne peut pas finir par un point ou un espace"
 
-        # Vérifie la présence de caractères de contrôle
-        if any(ord(char) < 32 for char in name):
+        # Vérifie la présence de caractères de contrôle (seuls invalides restants)
+        if has_invalid:
             return False, "Le nom contient des caractères de contrôle invalides"
 
         return True, ""
@@ -107,15 +113,17 @@ class FilenameValidator:
         if not name:
             return "nouveau_dossier"
 
+        # Un nom déjà valide n'a rien à corriger
+        if cls.validate(name)[0]:
+            return name
+
         # Nettoie les espaces
         fixed = name.strip()
 
-        # Supprime les caractères interdits
-        for char in cls.FORBIDDEN_CHARS:
-            fixed = fixed.replace(char, "_")
-
-        # Supprime les caractères de contrôle
-        fixed = "".join(char for char in fixed if ord(char) >= 32)
+        # Remplace les caractères interdits et supprime ceux de contrôle (une passe)
+        fixed = cls._INVALID_RE.sub(
+            lambda match: "" if match.group() < " " else "_", fixed
+        )
 
         # Supprime les points/espaces en fin
         fixed = fixed.rstrip(". ")
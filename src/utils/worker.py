@@ -0,0 +1,60 @@
+# src/utils/worker.py
+"""
+Exécution de tâches bloquantes hors du thread GUI via le QThreadPool global.
+"""
+
+from typing import Callable
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from loguru import logger
+
+
+class TaskSignals(QObject):
+    """Signaux d'une tâche de fond (livrés dans le thread du receveur)."""
+
+    progress = pyqtSignal(str)  # message d'état intermédiaire
+    finished = pyqtSignal(object)  # valeur de retour de la fonction
+    failed = pyqtSignal(object)  # exception levée par la fonction
+
+
+class BackgroundTask(QRunnable):
+    """
+    Exécute une fonction dans un thread du QThreadPool.
+
+    Le résultat et les erreurs remontent par signaux : les slots connectés
+    depuis le thread GUI y sont exécutés (connexion mise en file d'attente).
+    """
+
+    # Signaux des tâches en cours, gardés en vie jusqu'à la livraison du résultat
+    _active = set()
+
+    def __init__(self, fn: Callable, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = TaskSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            name = getattr(self.fn, "__qualname__", repr(self.fn))
+            logger.error(f"Erreur dans la tâche de fond {name}: {e}")
+            self.signals.failed.emit(e)
+        else:
+            self.signals.finished.emit(result)
+
+    def start(self):
+        """Soumet la tâche au QThreadPool global."""
+        signals = self.signals
+        BackgroundTask._active.add(signals)
+
+        # Connecté en dernier : libéré après les slots de l'appelant.
+        # Une lambda (et non une méthode liée, référencée faiblement par PyQt)
+        # reste valide même si la tâche est détruite entre-temps.
+        release = lambda _: BackgroundTask._active.discard(signals)
+        signals.finished.connect(release)
+        signals.failed.connect(release)
+
+        QThreadPool.globalInstance().start(self)